@@ -0,0 +1,72 @@
+# Copyright 2021 TileDB Inc.
+# Licensed under the MIT License.
+"""Benchmarks comparing aligned copy blocks with naive row-major slabs.
+
+The counts are computed from the block plans:
+
+* chunk reads: the number of times a NetCDF chunk is decompressed by a block read,
+* tile writes: the number of times a TileDB tile is written to by a block write
+  (every write beyond the first for a tile creates a partial tile), and
+* fragments: the number of write queries (one fragment per block).
+"""
+from tiledb.cf.blocks import BlockPlanner
+
+SHAPE = (365, 720, 1440)
+CHUNKS = (1, 180, 360)
+TILES = (5, 360, 360)
+CELL_NBYTES = 8
+
+
+def _count_intersections(planner, unit):
+    """Returns the total number of (block, unit) pairs that overlap."""
+    total = 0
+    for indexer in planner:
+        count = 1
+        for dim_slice, size in zip(indexer, unit):
+            count *= (dim_slice.stop - 1) // size - dim_slice.start // size + 1
+        total += count
+    return total
+
+
+def _ntotal(unit):
+    count = 1
+    for size, unit_size in zip(SHAPE, unit):
+        count *= -(-size // unit_size)
+    return count
+
+
+class BlockPlanSuite:
+    params = ([2**20, 2**24, 2**27, 2**30], ["naive", "aligned"])
+    param_names = ["memory_budget", "plan"]
+
+    def setup(self, memory_budget, plan):
+        if plan == "naive":
+            self.planner = BlockPlanner(SHAPE, CELL_NBYTES, memory_budget)
+        else:
+            self.planner = BlockPlanner(
+                SHAPE, CELL_NBYTES, memory_budget, tiles=TILES, chunks=[CHUNKS]
+            )
+
+    def time_plan(self, memory_budget, plan):
+        for _ in self.planner:
+            pass
+
+    def track_chunk_reads(self, memory_budget, plan):
+        return _count_intersections(self.planner, CHUNKS)
+
+    track_chunk_reads.unit = "chunks"
+
+    def track_redundant_chunk_reads(self, memory_budget, plan):
+        return _count_intersections(self.planner, CHUNKS) - _ntotal(CHUNKS)
+
+    track_redundant_chunk_reads.unit = "chunks"
+
+    def track_partial_tile_writes(self, memory_budget, plan):
+        return _count_intersections(self.planner, TILES) - _ntotal(TILES)
+
+    track_partial_tile_writes.unit = "tiles"
+
+    def track_fragments(self, memory_budget, plan):
+        return len(self.planner)
+
+    track_fragments.unit = "fragments"
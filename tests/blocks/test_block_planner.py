@@ -0,0 +1,95 @@
+# Copyright 2021 TileDB Inc.
+# Licensed under the MIT License.
+import numpy as np
+import pytest
+
+from tiledb.cf.blocks import BlockPlanner
+
+
+@pytest.mark.parametrize(
+    "kwargs, alignment, block_shape",
+    [
+        ({"shape": (8, 8)}, (1, 1), (8, 8)),
+        ({"shape": (8, 8), "memory_budget": 8}, (1, 1), (1, 8)),
+        ({"shape": (8, 8), "memory_budget": 16, "tiles": (4, 4)}, (4, 4), (4, 4)),
+        ({"shape": (8, 8), "memory_budget": 32, "tiles": (4, 4)}, (4, 4), (4, 8)),
+        ({"shape": (8, 8), "memory_budget": 8, "tiles": (4, 4)}, (1, 1), (1, 8)),
+        (
+            {"shape": (8, 8), "memory_budget": 16, "chunks": [(2, 4), (4, 2)]},
+            (4, 4),
+            (4, 4),
+        ),
+        (
+            {
+                "shape": (12, 8),
+                "memory_budget": 48,
+                "tiles": (4, 4),
+                "chunks": [(6, 4)],
+            },
+            (12, 4),
+            (12, 4),
+        ),
+        (
+            {
+                "shape": (12, 8),
+                "memory_budget": 24,
+                "tiles": (4, 4),
+                "chunks": [(6, 4)],
+            },
+            (6, 4),
+            (6, 4),
+        ),
+        ({"shape": (3, 5), "memory_budget": 64, "tiles": (None, 10)}, (1, 5), (3, 5)),
+        (
+            {"shape": (8, 8), "cell_nbytes": 8, "memory_budget": 128, "tiles": (4, 4)},
+            (4, 4),
+            (4, 4),
+        ),
+    ],
+)
+def test_block_shape(kwargs, alignment, block_shape):
+    planner = BlockPlanner(**kwargs)
+    assert planner.alignment == alignment
+    assert planner.block_shape == block_shape
+
+
+@pytest.mark.parametrize(
+    "shape, memory_budget, tiles, chunks",
+    [
+        ((8, 8), None, None, ()),
+        ((7, 9), 12, (4, 4), ()),
+        ((10, 3, 5), 30, (5, 3, 5), [(2, 3, 5)]),
+        ((5,), 2, None, [(3,)]),
+    ],
+)
+def test_blocks_cover_region(shape, memory_budget, tiles, chunks):
+    planner = BlockPlanner(
+        shape, memory_budget=memory_budget, tiles=tiles, chunks=chunks
+    )
+    count = np.zeros(shape, dtype=np.int32)
+    blocks = list(planner)
+    for indexer in blocks:
+        count[indexer] += 1
+    assert np.all(count == 1)
+    assert len(planner) == len(blocks)
+
+
+def test_empty_region():
+    planner = BlockPlanner((0, 4), memory_budget=8)
+    assert list(planner) == []
+    assert len(planner) == 0
+
+
+def test_bad_memory_budget_error():
+    with pytest.raises(ValueError):
+        BlockPlanner((4,), memory_budget=0)
+
+
+def test_bad_tiles_error():
+    with pytest.raises(ValueError):
+        BlockPlanner((4, 4), tiles=(4,))
+
+
+def test_bad_chunks_error():
+    with pytest.raises(ValueError):
+        BlockPlanner((4, 4), chunks=[(2, 2, 2)])
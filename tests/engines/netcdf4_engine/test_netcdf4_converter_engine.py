@@ -77,6 +77,24 @@ class ConvertNetCDFBase:
         converter.convert_to_group(uri)
         self.check_attrs(uri)
 
+    @pytest.mark.parametrize("collect_attrs", [True, False])
+    def test_converter_memory_budget(self, netcdf_file, tmpdir, collect_attrs):
+        converter = NetCDF4ConverterEngine.from_file(
+            netcdf_file, coords_to_dims=False, collect_attrs=collect_attrs
+        )
+        uri = str(tmpdir.mkdir("output").join(self.name))
+        converter.convert_to_group(uri, memory_budget=16)
+        self.check_attrs(uri)
+
+    @pytest.mark.parametrize("collect_attrs", [True, False])
+    def test_converter_max_workers(self, netcdf_file, tmpdir, collect_attrs):
+        converter = NetCDF4ConverterEngine.from_file(
+            netcdf_file, coords_to_dims=False, collect_attrs=collect_attrs
+        )
+        uri = str(tmpdir.mkdir("output").join(self.name))
+        converter.convert_to_group(uri, memory_budget=16, max_workers=4)
+        self.check_attrs(uri)
+
     def test_converter_html_repr(self, netcdf_file):
         converter = NetCDF4ConverterEngine.from_file(netcdf_file)
         try:
@@ -482,6 +500,55 @@ class TestConvertNetCDFMatchingChunks(ConvertNetCDFBase):
         tiles = tuple(dim.tile for dim in group_schema["array0"].domain)
         assert tiles == (2, 4)
 
+    @pytest.mark.parametrize(
+        "memory_budget, nfragments", [(None, 1), (64, 8), (16, 32), (1, 64)]
+    )
+    def test_copy_memory_budget_fragments(
+        self, netcdf_file, tmpdir, memory_budget, nfragments
+    ):
+        uri = str(tmpdir.mkdir("output").join("memory_budget"))
+        converter = NetCDF4ConverterEngine.from_file(netcdf_file, coords_to_dims=False)
+        converter.convert_to_group(uri, memory_budget=memory_budget)
+        assert len(tiledb.array_fragments(uri + "/array0")) == nfragments
+        self.check_attrs(uri)
+
+    def test_copy_memory_budget_aligned_blocks(self, netcdf_file, tmpdir):
+        uri = str(tmpdir.mkdir("output").join("aligned_blocks"))
+        converter = NetCDF4ConverterEngine.from_file(netcdf_file, coords_to_dims=False)
+        with netCDF4.Dataset(netcdf_file) as dataset:
+            planner = converter._registry.get_array_creator("array0").plan_blocks(
+                dataset, (8, 8), memory_budget=128
+            )
+        assert planner.alignment == (4, 4)
+        assert planner.block_shape == (4, 4)
+        converter.convert_to_group(uri, memory_budget=128)
+        fragments = tiledb.array_fragments(uri + "/array0")
+        assert sorted(fragment.nonempty_domain for fragment in fragments) == [
+            ((0, 3), (0, 3)),
+            ((0, 3), (4, 7)),
+            ((4, 7), (0, 3)),
+            ((4, 7), (4, 7)),
+        ]
+        self.check_attrs(uri)
+
+    def test_copy_sparse_memory_budget(self, netcdf_file, tmpdir):
+        uri = str(tmpdir.mkdir("output").join("sparse_memory_budget"))
+        converter = NetCDF4ConverterEngine.from_file(netcdf_file, coords_to_dims=False)
+        converter.set_array_properties("array0", sparse=True)
+        converter.convert_to_group(uri, memory_budget=400)
+        assert len(tiledb.array_fragments(uri + "/array0")) == 4
+        with Group(uri, array="array0") as group:
+            data = group.array[:, :]
+        order = np.lexsort((data["col"], data["row"]))
+        assert np.array_equal(data["x1"][order], self.variable_data["x1"].flatten())
+        assert np.array_equal(data["x2"][order], self.variable_data["x2"].flatten())
+
+    def test_copy_bad_memory_budget_error(self, netcdf_file, tmpdir):
+        uri = str(tmpdir.mkdir("output").join("bad_memory_budget"))
+        converter = NetCDF4ConverterEngine.from_file(netcdf_file, coords_to_dims=False)
+        with pytest.raises(ValueError):
+            converter.convert_to_group(uri, memory_budget=0)
+
 
 class TestConvertNetCDFMismatchingChunks(ConvertNetCDFBase):
     """NetCDF conversion test cases for a NetCDF file with two variables over the same
@@ -542,6 +609,37 @@ class TestConvertNetCDFMismatchingChunks(ConvertNetCDFBase):
         x2_expected = np.arange(64, 128, dtype=np.int32)
         assert np.array_equal(x2_result, x2_expected)
 
+    def test_max_workers_virtual_group(self, tmpdir, netcdf_file):
+        uri = str(tmpdir.mkdir("output").join("virtual_max_workers"))
+        converter = NetCDF4ConverterEngine.from_file(
+            netcdf_file, coords_to_dims=False, collect_attrs=False
+        )
+        converter.convert_to_virtual_group(uri, memory_budget=32, max_workers=2)
+        for attr_name, var_name in self.attr_to_var_map.items():
+            with tiledb.open(f"{uri}_{attr_name}", attr=attr_name) as array:
+                result = array[:, :]
+            assert np.array_equal(result, self.variable_data[var_name])
+
+    def test_max_workers_error_per_array(self, tmpdir, netcdf_file):
+        uri = str(tmpdir.mkdir("output").join("max_workers_error"))
+        converter = NetCDF4ConverterEngine.from_file(
+            netcdf_file, coords_to_dims=False, collect_attrs=False
+        )
+        converter.create_group(uri)
+        with netCDF4.Dataset("empty.nc", mode="w", diskless=True) as dataset:
+            dataset.createDimension("row", 8)
+            dataset.createDimension("col", 8)
+            with pytest.raises(RuntimeError) as excinfo:
+                converter.copy_to_group(uri, input_netcdf_group=dataset, max_workers=2)
+        assert "array 'x1'" in str(excinfo.value)
+        assert "array 'x2'" in str(excinfo.value)
+
+    def test_bad_max_workers_error(self, tmpdir, netcdf_file):
+        uri = str(tmpdir.mkdir("output").join("bad_max_workers"))
+        converter = NetCDF4ConverterEngine.from_file(netcdf_file, coords_to_dims=False)
+        with pytest.raises(ValueError):
+            converter.convert_to_group(uri, max_workers=0)
+
 
 class TestConvertNetCDFSingleVariableChunk(ConvertNetCDFBase):
     """NetCDF conversion test cases for a NetCDF file with two variables: one with the
@@ -51,6 +51,18 @@ class TestNetCDFCoordToDimConverterUnlimCoord:
             result = converter.get_values(dataset, sparse=True)
         assert np.array_equal(result, data)
 
+    def test_get_values_with_indexer(self):
+        data = np.random.rand((8))
+        with netCDF4.Dataset("example.nc", mode="w", diskless=True) as dataset:
+            dataset.createDimension("value")
+            var = dataset.createVariable("value", np.float64, ("value",))
+            var[:] = data
+            registry = DataspaceRegistry()
+            converter = NetCDF4CoordToDimConverter.from_netcdf(registry, var)
+            assert converter.get_query_size(dataset) == 8
+            result = converter.get_values(dataset, sparse=True, indexer=slice(3, 6))
+        assert np.array_equal(result, data[3:6])
+
     def test_get_values_no_data(self):
         with netCDF4.Dataset("example.nc", mode="w", diskless=True) as dataset:
             dataset.createDimension("value")
@@ -143,6 +155,20 @@ class TestNetCDFDimToDimConverterSimpleDim:
             result = converter.get_values(group, sparse=sparse)
             assert np.array_equal(result, values)
 
+    @pytest.mark.parametrize(
+        "sparse,values", [(True, np.arange(2, 5)), (False, slice(2, 5))]
+    )
+    def test_get_values_with_indexer(self, sparse, values):
+        with netCDF4.Dataset("example.nc", mode="w", diskless=True) as dataset:
+            dim = dataset.createDimension("row", 8)
+            registry = DataspaceRegistry()
+            converter = NetCDF4DimToDimConverter.from_netcdf(
+                registry, dim, 1000, np.uint64
+            )
+            assert converter.get_query_size(dataset) == 8
+            result = converter.get_values(dataset, sparse=sparse, indexer=slice(2, 5))
+            assert np.array_equal(result, values)
+
     def test_no_dim_error(self):
         with netCDF4.Dataset("example.nc", mode="w", diskless=True) as dataset:
             dim = dataset.createDimension("row", 8)
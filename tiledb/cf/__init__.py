@@ -101,6 +101,20 @@ def cli():
     show_default=True,
     help="The data type for TileDB dimensions created from converted NetCDF.",
 )
+@click.option(
+    "--memory-budget",
+    type=int,
+    default=None,
+    show_default=True,
+    help="Maximum number of bytes to read from NetCDF at once when copying an array.",
+)
+@click.option(
+    "--max-workers",
+    type=int,
+    default=None,
+    show_default=True,
+    help="Maximum number of threads used to copy arrays in a group at the same time.",
+)
 def netcdf_convert(
     input_file: str,
     output_uri: str,
@@ -110,6 +124,8 @@ def netcdf_convert(
     unlimited_dim_size: int,
     dim_dtype: str,
     collect_attrs: bool,
+    memory_budget: Optional[int],
+    max_workers: Optional[int],
 ):
     """Converts a NetCDF input file to nested TileDB groups."""
     from_netcdf(
@@ -125,4 +141,6 @@ def netcdf_convert(
         tiles_by_dims=None,
         coords_to_dims=False,
         collect_attrs=collect_attrs,
+        memory_budget=memory_budget,
+        max_workers=max_workers,
     )
@@ -0,0 +1,144 @@
+# Copyright 2021 TileDB Inc.
+# Licensed under the MIT License.
+"""Classes for splitting a region of an array into blocks for reading and writing."""
+
+from __future__ import annotations
+
+import itertools
+import math
+from typing import Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+def _lcm(first: int, second: int) -> int:
+    """Returns the least common multiple of two positive integers."""
+    return first * second // math.gcd(first, second)
+
+
+class BlockPlanner:
+    """Planner for splitting a region into ordered, aligned hyperslab blocks.
+
+    The planner splits a region that starts at index 0 into blocks that are aligned to
+    both the tiles of a TileDB array and the chunks of the source data. Aligning the
+    blocks to the source chunks prevents a chunk from being decompressed for multiple
+    blocks, and aligning the blocks to the TileDB tiles prevents writes from creating
+    partial tiles.
+
+    The block shape is computed from an alignment unit: along each dimension, the
+    least common multiple of the tile extent and all chunk sizes. Blocks are grown from
+    the last dimension to the first in multiples of the alignment unit until they fill
+    the memory budget. If the alignment unit does not fit in the memory budget, the
+    planner drops the tile alignment, then the chunk alignment, before falling back to
+    unaligned blocks.
+
+    Parameters:
+        shape: The shape of the region to split into blocks.
+        cell_nbytes: The number of bytes required to store a single cell.
+        memory_budget: If not ``None``, the maximum number of bytes in a block.
+            Otherwise, the block is the entire region.
+        tiles: If not ``None``, the TileDB tile extents for each dimension. Use
+            ``None`` for dimensions that should not be tile aligned.
+        chunks: A sequence of chunk shapes for the source data. Use ``None`` for
+            a source without chunks.
+
+    Attributes:
+        shape: The shape of the region to split into blocks.
+        alignment: The alignment unit the blocks are a multiple of.
+        block_shape: The shape of a block. Blocks on the upper boundary of the region
+            may be smaller.
+    """
+
+    def __init__(
+        self,
+        shape: Sequence[int],
+        cell_nbytes: int = 1,
+        memory_budget: Optional[int] = None,
+        tiles: Optional[Sequence[Optional[int]]] = None,
+        chunks: Sequence[Optional[Sequence[int]]] = (),
+    ):
+        if memory_budget is not None and memory_budget <= 0:
+            raise ValueError(
+                f"Cannot plan blocks with a memory budget of {memory_budget} bytes. "
+                f"The memory budget must be positive."
+            )
+        if tiles is not None and len(tiles) != len(shape):
+            raise ValueError(
+                f"Cannot plan blocks. Got {len(tiles)} tile(s) for a region with "
+                f"{len(shape)} dimension(s)."
+            )
+        for chunk_shape in chunks:
+            if chunk_shape is not None and len(chunk_shape) != len(shape):
+                raise ValueError(
+                    f"Cannot plan blocks. Got chunks {chunk_shape} for a region with "
+                    f"{len(shape)} dimension(s)."
+                )
+        self.shape = tuple(int(size) for size in shape)
+        tile_unit = self._unit(() if tiles is None else (tiles,))
+        chunk_unit = self._unit(chunks)
+        full_unit = tuple(
+            max(min(_lcm(tile, chunk), size), 1)
+            for tile, chunk, size in zip(tile_unit, chunk_unit, self.shape)
+        )
+        max_cells = (
+            None
+            if memory_budget is None
+            else max(memory_budget // max(cell_nbytes, 1), 1)
+        )
+        for unit in (full_unit, chunk_unit, tile_unit, (1,) * len(self.shape)):
+            if max_cells is None or np.prod(unit, dtype=np.int64) <= max_cells:
+                break
+        self.alignment = unit
+        self.block_shape = self._grow(unit, max_cells)
+
+    def __iter__(self) -> Iterator[Tuple[slice, ...]]:
+        """Yields the indexers for each block in row-major order."""
+        if 0 in self.shape:
+            return
+        starts = (
+            range(0, size, block) for size, block in zip(self.shape, self.block_shape)
+        )
+        for start in itertools.product(*starts):
+            yield tuple(
+                slice(dim_start, min(dim_start + block, size))
+                for dim_start, block, size in zip(start, self.block_shape, self.shape)
+            )
+
+    def __len__(self) -> int:
+        """Returns the number of blocks in the region."""
+        return int(
+            np.prod(
+                [-(-size // block) for size, block in zip(self.shape, self.block_shape)]
+            )
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"BlockPlanner(shape={self.shape}, alignment={self.alignment}, "
+            f"block_shape={self.block_shape})"
+        )
+
+    def _grow(self, unit: Sequence[int], max_cells: Optional[int]) -> Tuple[int, ...]:
+        """Returns the largest multiple of the alignment unit that fits in the memory
+        budget, growing the trailing dimensions first."""
+        if max_cells is None:
+            return self.shape
+        block_shape: List[int] = list(unit)
+        nunits = max(max_cells // int(np.prod(unit, dtype=np.int64)), 1)
+        for index in reversed(range(len(self.shape))):
+            dim_nunits = max(min(-(-self.shape[index] // unit[index]), nunits), 1)
+            block_shape[index] = min(unit[index] * dim_nunits, self.shape[index])
+            nunits //= dim_nunits
+        return tuple(max(block, 1) for block in block_shape)
+
+    def _unit(self, shapes: Sequence[Optional[Sequence[Optional[int]]]]):
+        """Returns the least common multiple of the provided shapes capped by the
+        region shape."""
+        unit = [1] * len(self.shape)
+        for item_shape in shapes:
+            if item_shape is None:
+                continue
+            for index, item in enumerate(item_shape):
+                if item is not None and item > 0:
+                    unit[index] = min(_lcm(unit[index], int(item)), self.shape[index])
+        return tuple(max(value, 1) for value in unit)
@@ -26,6 +26,8 @@ def from_netcdf(
     coords_to_dims: bool = False,
     collect_attrs: bool = True,
     use_virtual_groups: bool = False,
+    memory_budget: Optional[int] = None,
+    max_workers: Optional[int] = None,
 ):
     """Converts a NetCDF input file to nested TileDB CF dataspaces.
 
@@ -61,6 +63,11 @@ def from_netcdf(
             TileDB attribute.
         collect_attrs: If ``True``, store all attributes with the same dimensions in
             the same array. Otherwise, store each attribute in a scalar array.
+        memory_budget: If not ``None``, the maximum number of bytes to read from the
+            NetCDF file at once when copying data into a TileDB array. The data is
+            copied in blocks that fit in the budget.
+        max_workers: If not ``None``, the maximum number of threads used to copy
+            data into the TileDB arrays of a group at the same time.
     """
     from .netcdf4_engine import NetCDF4ConverterEngine, open_netcdf_group
 
@@ -87,7 +94,12 @@ def from_netcdf(
             else output_uri + netcdf_group.path.replace("/", "_")
         )
         converter.convert_to_virtual_group(
-            group_uri, output_key, output_ctx, input_netcdf_group=netcdf_group
+            group_uri,
+            output_key,
+            output_ctx,
+            input_netcdf_group=netcdf_group,
+            memory_budget=memory_budget,
+            max_workers=max_workers,
         )
         if recursive:
             for subgroup in netcdf_group.groups.values():
@@ -105,7 +117,12 @@ def from_netcdf(
         )
         group_uri = output_uri + netcdf_group.path
         converter.convert_to_group(
-            group_uri, output_key, output_ctx, input_netcdf_group=netcdf_group
+            group_uri,
+            output_key,
+            output_ctx,
+            input_netcdf_group=netcdf_group,
+            memory_budget=memory_budget,
+            max_workers=max_workers,
         )
         if recursive:
             for subgroup in netcdf_group.groups.values():
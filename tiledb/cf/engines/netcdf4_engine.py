@@ -2,20 +2,34 @@
 # Licensed under the MIT License.
 """Classes for converting NetCDF4 files to TileDB."""
 
+import threading
 import time
 import warnings
 from abc import abstractmethod
 from collections import defaultdict
-from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager, nullcontext
 from io import StringIO
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+from typing import (
+    Any,
+    Callable,
+    ContextManager,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 import netCDF4
 import numpy as np
 
 import tiledb
 
+from ..blocks import BlockPlanner
 from ..core import AttrMetadata, Group
 from ..creator import (
     ArrayCreator,
@@ -44,9 +58,21 @@ class NetCDF4ToAttrConverter(AttrCreator):
             tiledb_array: TileDB array to copy the metadata items to.
         """
 
+    def get_chunks(self, netcdf_group: netCDF4.Dataset) -> Optional[Tuple[int, ...]]:
+        """Returns the chunk shape of the NetCDF data or ``None`` if the data is not
+        chunked.
+
+        Parameters:
+            netcdf_group: NetCDF group to get the chunks from.
+        """
+        return None
+
     @abstractmethod
     def get_values(
-        self, netcdf_group: netCDF4.Dataset, sparse: bool
+        self,
+        netcdf_group: netCDF4.Dataset,
+        sparse: bool,
+        indexer: Optional[Tuple[slice, ...]] = None,
     ) -> Union[np.ndarray, slice]:
         """Returns values from a NetCDF group that will be copied to TileDB.
 
@@ -54,6 +80,8 @@ class NetCDF4ToAttrConverter(AttrCreator):
             netcdf_group: NetCDF group to get the values from.
             sparse: ``True`` if copying into a sparse array and ``False`` if copying
                 into a dense array.
+            indexer: If not ``None``, the slices of the NetCDF data to return values
+                for. Otherwise, return all values.
 
         Returns:
             The coordinates needed for querying the create TileDB dimension in the form
@@ -74,9 +102,20 @@ class NetCDF4ToDimConverter(SharedDim):
             tiledb_array: TileDB array to copy the metadata items to.
         """
 
+    @abstractmethod
+    def get_query_size(self, netcdf_group: netCDF4.Dataset) -> int:
+        """Returns the number of values that will be copied from the NetCDF group.
+
+        Parameters:
+            netcdf_group: NetCDF group to get the values from.
+        """
+
     @abstractmethod
     def get_values(
-        self, netcdf_group: netCDF4.Dataset, sparse: bool
+        self,
+        netcdf_group: netCDF4.Dataset,
+        sparse: bool,
+        indexer: Optional[slice] = None,
     ) -> Union[np.ndarray, slice]:
         """Returns values from a NetCDF group that will be copied to TileDB.
 
@@ -84,6 +123,8 @@ class NetCDF4ToDimConverter(SharedDim):
             netcdf_group: NetCDF group to get the values from.
             sparse: ``True`` if copying into a sparse array and ``False`` if copying
                 into a dense array.
+            indexer: If not ``None``, the slice of the NetCDF values to return.
+                Otherwise, return all values.
 
         Returns:
             The coordinates needed for querying the create TileDB dimension in the form
@@ -178,10 +219,20 @@ class NetCDF4CoordToDimConverter(NetCDF4ToDimConverter):
             input_dtype=dtype,
         )
 
+    def get_query_size(self, netcdf_group: netCDF4.Dataset) -> int:
+        """Returns the number of values that will be copied from the NetCDF
+        coordinate.
+
+        Parameters:
+            netcdf_group: NetCDF group to get the coordinate values from.
+        """
+        return self._get_variable(netcdf_group).get_dims()[0].size
+
     def get_values(
         self,
         netcdf_group: netCDF4.Dataset,
         sparse: bool,
+        indexer: Optional[slice] = None,
     ):
         """Returns the values of the NetCDF coordinate that is being copied, or
         None if the coordinate is of size 0.
@@ -190,6 +241,8 @@ class NetCDF4CoordToDimConverter(NetCDF4ToDimConverter):
             netcdf_group: NetCDF group to get the coordinate values from.
             sparse: ``True`` if copying into a sparse array and ``False`` if copying
                 into a dense array.
+            indexer: If not ``None``, the slice of the NetCDF coordinate to return.
+                Otherwise, return all values.
 
         Returns:
             The coordinate values needed for querying the TileDB dimension in the
@@ -200,6 +253,12 @@ class NetCDF4CoordToDimConverter(NetCDF4ToDimConverter):
                 "Support for copying NetCDF coordinates to dense arrays has not "
                 "been implemented."
             )
+        variable = self._get_variable(netcdf_group)
+        if variable.get_dims()[0].size < 1:
+            return None
+        return variable[:] if indexer is None else variable[indexer]
+
+    def _get_variable(self, netcdf_group: netCDF4.Dataset) -> netCDF4.Variable:
         try:
             variable = netcdf_group.variables[self.input_name]
         except KeyError as err:
@@ -213,9 +272,7 @@ class NetCDF4CoordToDimConverter(NetCDF4ToDimConverter):
                 f"not a valid NetCDF coordinate. Cannot copy data from variable "
                 f"'{self.input_name}' to TileDB dimension '{self.name}'."
             )
-        if variable.get_dims()[0].size < 1:
-            return None
-        return variable[:]
+        return variable
 
     @property
     def is_index_dim(self) -> bool:
@@ -314,19 +371,11 @@ class NetCDF4DimToDimConverter(NetCDF4ToDimConverter):
             is_unlimited=dim.isunlimited(),
         )
 
-    def get_values(
-        self, netcdf_group: netCDF4.Dataset, sparse: bool
-    ) -> Union[np.ndarray, slice]:
-        """Returns the values of the NetCDF dimension that is being copied.
+    def get_query_size(self, netcdf_group: netCDF4.Dataset) -> int:
+        """Returns the size of the NetCDF dimension that is being copied.
 
         Parameters:
-            netcdf_group: NetCDF group to get the dimension values from.
-            sparse: ``True`` if copying into a sparse array and ``False`` if copying
-                into a dense array.
-
-        Returns:
-            The coordinates needed for querying the created TileDB dimension in the form
-                of a numpy array if sparse is ``True`` and a slice otherwise.
+            netcdf_group: NetCDF group to get the dimension from.
         """
         group = netcdf_group
         while group is not None:
@@ -347,9 +396,7 @@ class NetCDF4DimToDimConverter(NetCDF4ToDimConverter):
                         f"NetCDF dimension size of {dim.size} does not fit in the "
                         f"domain {self.domain} of the TileDB dimension."
                     )
-                if sparse:
-                    return np.arange(dim.size)
-                return slice(dim.size)
+                return dim.size
             group = group.parent
         raise KeyError(
             f"Unable to copy NetCDF dimension '{self.input_name}' to the TileDB "
@@ -357,6 +404,31 @@ class NetCDF4DimToDimConverter(NetCDF4ToDimConverter):
             f"the NetCDF group '{netcdf_group.path}' or its parent groups."
         )
 
+    def get_values(
+        self,
+        netcdf_group: netCDF4.Dataset,
+        sparse: bool,
+        indexer: Optional[slice] = None,
+    ) -> Union[np.ndarray, slice]:
+        """Returns the values of the NetCDF dimension that is being copied.
+
+        Parameters:
+            netcdf_group: NetCDF group to get the dimension values from.
+            sparse: ``True`` if copying into a sparse array and ``False`` if copying
+                into a dense array.
+            indexer: If not ``None``, the slice of the NetCDF dimension to return
+                values for. Otherwise, return values for the entire dimension.
+
+        Returns:
+            The coordinates needed for querying the created TileDB dimension in the form
+                of a numpy array if sparse is ``True`` and a slice otherwise.
+        """
+        size = self.get_query_size(netcdf_group)
+        if indexer is None:
+            return np.arange(size) if sparse else slice(size)
+        start, stop, _ = indexer.indices(size)
+        return np.arange(start, stop) if sparse else slice(start, stop)
+
 
 class NetCDF4ScalarToDimConverter(NetCDF4ToDimConverter):
     """Converter for NetCDF scalar (empty) dimensions to a TileDB Dimension.
@@ -379,8 +451,19 @@ class NetCDF4ScalarToDimConverter(NetCDF4ToDimConverter):
         """Returns a string HTML summary."""
         return "NetCDF empty dimension"
 
+    def get_query_size(self, netcdf_group: netCDF4.Dataset) -> int:
+        """Returns the size of the scalar dimension. This is always 1.
+
+        Parameters:
+            netcdf_group: NetCDF group to get the dimension values from.
+        """
+        return 1
+
     def get_values(
-        self, netcdf_group: netCDF4.Dataset, sparse: bool
+        self,
+        netcdf_group: netCDF4.Dataset,
+        sparse: bool,
+        indexer: Optional[slice] = None,
     ) -> Union[np.ndarray, slice]:
         """Get dimension values from a NetCDF group.
 
@@ -388,6 +471,7 @@ class NetCDF4ScalarToDimConverter(NetCDF4ToDimConverter):
             netcdf_group: NetCDF group to get the dimension values from.
             sparse: ``True`` if copying into a sparse array and ``False`` if copying
                 into a dense array.
+            indexer: Unused. A scalar dimension only has a single value.
 
         Returns:
             The coordinates needed for querying the create TileDB dimension in the form
@@ -540,8 +624,23 @@ class NetCDF4VarToAttrConverter(NetCDF4ToAttrConverter):
             input_dtype=ncvar.dtype,
         )
 
+    def get_chunks(self, netcdf_group: netCDF4.Dataset) -> Optional[Tuple[int, ...]]:
+        """Returns the chunk shape of the NetCDF variable or ``None`` if the variable
+        is not chunked.
+
+        Parameters:
+            netcdf_group: NetCDF group to get the chunks from.
+        """
+        variable = netcdf_group.variables.get(self.input_name)
+        if variable is None or variable.ndim == 0:
+            return None
+        return get_variable_chunks(variable)
+
     def get_values(
-        self, netcdf_group: netCDF4.Dataset, sparse: bool
+        self,
+        netcdf_group: netCDF4.Dataset,
+        sparse: bool,
+        indexer: Optional[Tuple[slice, ...]] = None,
     ) -> Union[np.ndarray, slice]:
         """Returns TileDB attribute values from a NetCDF group.
 
@@ -549,6 +648,9 @@ class NetCDF4VarToAttrConverter(NetCDF4ToAttrConverter):
             netcdf_group: NetCDF group to get the dimension values from.
             sparse: ``True`` if copying into a sparse array and ``False`` if copying
                 into a dense array.
+            indexer: If not ``None``, the slices of the NetCDF variable to return
+                values for. Otherwise, return the entire variable. Ignored for scalar
+                variables.
 
         Returns:
             The values needed to set an attribute in a TileDB array. If the array
@@ -562,7 +664,12 @@ class NetCDF4VarToAttrConverter(NetCDF4ToAttrConverter):
                 f"The variable '{self.input_name}' was not found in the provided "
                 f"NetCDF group."
             ) from err
-        return variable[...].flatten() if sparse else variable[...]
+        values = (
+            variable[...]
+            if indexer is None or variable.ndim == 0
+            else variable[indexer]
+        )
+        return values.flatten() if sparse else values
 
 
 class NetCDF4ArrayConverter(ArrayCreator):
@@ -716,27 +823,115 @@ class NetCDF4ArrayConverter(ArrayCreator):
         self,
         netcdf_group: netCDF4.Group,
         tiledb_array: tiledb.Array,
+        memory_budget: Optional[int] = None,
+        netcdf_lock: Optional[ContextManager] = None,
     ):
         """Copies data from a NetCDF group to a TileDB CF array.
 
+        If a memory budget is provided, the data is copied in blocks of NetCDF
+        hyperslabs. Only one block is read into memory at a time, and each block is
+        written to TileDB in a separate write query. When possible, the blocks are
+        aligned to both the NetCDF chunks and the TileDB tiles (see
+        :class:`tiledb.cf.blocks.BlockPlanner`).
+
         Parameters:
             netcdf_group: The NetCDF group to copy data from.
             tiledb_arary: The TileDB array to copy data into. The array must be open
                 in write mode.
+            memory_budget: If not ``None``, the maximum number of bytes of attribute
+                data (and coordinate data for sparse arrays) to read in a single
+                block. Otherwise, copy all data in a single block.
+            netcdf_lock: If not ``None``, a lock that is held while reading from the
+                NetCDF group. Use a shared lock when copying multiple arrays from the
+                same NetCDF file concurrently.
         """
-        data = {}
-        for attr_converter in self:
-            assert isinstance(attr_converter, NetCDF4ToAttrConverter)
-            data[attr_converter.name] = attr_converter.get_values(
-                netcdf_group, sparse=self.sparse
-            )
-            attr_converter.copy_metadata(netcdf_group, tiledb_array)
-        dim_query = []
-        for dim_creator in self._domain_creator:
-            assert isinstance(dim_creator.base, NetCDF4ToDimConverter)
-            dim_query.append(
-                dim_creator.base.get_values(netcdf_group, sparse=self.sparse)
+        if netcdf_lock is None:
+            netcdf_lock = nullcontext()
+        with netcdf_lock:
+            for attr_converter in self:
+                assert isinstance(attr_converter, NetCDF4ToAttrConverter)
+                attr_converter.copy_metadata(netcdf_group, tiledb_array)
+            shape = []
+            for dim_creator in self._domain_creator:
+                assert isinstance(dim_creator.base, NetCDF4ToDimConverter)
+                shape.append(dim_creator.base.get_query_size(netcdf_group))
+            if 0 in shape:
+                return
+            planner = self.plan_blocks(netcdf_group, shape, memory_budget)
+        for indexer in planner:
+            self._copy_block(netcdf_group, tiledb_array, indexer, netcdf_lock)
+
+    def plan_blocks(
+        self,
+        netcdf_group: netCDF4.Group,
+        shape: Sequence[int],
+        memory_budget: Optional[int] = None,
+    ) -> BlockPlanner:
+        """Returns a block planner for copying data from a NetCDF group.
+
+        The blocks are aligned to the tiles of the dimensions that map directly to
+        NetCDF indices and to the chunks of the NetCDF variables.
+
+        Parameters:
+            netcdf_group: The NetCDF group to copy data from.
+            shape: The shape of the NetCDF region to copy.
+            memory_budget: If not ``None``, the maximum number of bytes of data to read
+                in a single block.
+        """
+        tiles = [
+            dim_creator.tile if dim_creator.base.is_index_dim else None
+            for dim_creator in self._domain_creator
+        ]
+        chunks = [
+            attr_converter.get_chunks(netcdf_group)  # type: ignore
+            for attr_converter in self
+        ]
+        return BlockPlanner(
+            shape,
+            cell_nbytes=self._cell_nbytes(),
+            memory_budget=memory_budget,
+            tiles=tiles,
+            chunks=[chunk for chunk in chunks if chunk is not None],
+        )
+
+    def _cell_nbytes(self) -> int:
+        """Returns the number of bytes read from NetCDF for a single cell."""
+        nbytes = sum(attr_converter.dtype.itemsize for attr_converter in self)
+        if self.sparse:
+            nbytes += sum(
+                dim_creator.dtype.itemsize for dim_creator in self._domain_creator
             )
+        return max(nbytes, 1)
+
+    def _copy_block(
+        self,
+        netcdf_group: netCDF4.Group,
+        tiledb_array: tiledb.Array,
+        indexer: Tuple[slice, ...],
+        netcdf_lock: ContextManager,
+    ):
+        """Copies a single block of data from a NetCDF group to a TileDB CF array.
+
+        Parameters:
+            netcdf_group: The NetCDF group to copy data from.
+            tiledb_array: The TileDB array to copy data into. The array must be open
+                in write mode.
+            indexer: The NetCDF hyperslab to copy.
+            netcdf_lock: Lock held while reading from the NetCDF group.
+        """
+        with netcdf_lock:
+            data = {
+                attr_converter.name: attr_converter.get_values(
+                    netcdf_group, sparse=self.sparse, indexer=indexer
+                )
+                for attr_converter in self
+            }
+            dim_query = [
+                dim_creator.base.get_values(
+                    netcdf_group, sparse=self.sparse, indexer=dim_indexer
+                )
+                for dim_creator, dim_indexer in zip(self._domain_creator, indexer)
+            ]
         if self.sparse:
             coord_values = tuple(
                 dim_data.flatten()
@@ -1271,6 +1466,7 @@ class NetCDF4ConverterEngine(DataspaceCreator):
         input_netcdf_group: Optional[netCDF4.Group] = None,
         input_file: Optional[Union[str, Path]] = None,
         input_group_path: Optional[str] = None,
+        memory_budget: Optional[int] = None,
     ):
         """Creates a TileDB arrays for a CF dataspace with only one array and copies
         data into it using the NetCDF converter engine.
@@ -1285,10 +1481,19 @@ class NetCDF4ConverterEngine(DataspaceCreator):
                 not be used if ``netcdf_group`` is not ``None``.
             input_group_path: If not ``None``, the path to the NetCDF group to copy data
                 from.
+            memory_budget: If not ``None``, the maximum number of bytes to read from
+                NetCDF at once when copying data into a TileDB array. The data is
+                copied in blocks that fit in the budget.
         """
         self.create_array(output_uri, key, ctx)
         self.copy_to_array(
-            output_uri, key, ctx, input_netcdf_group, input_file, input_group_path
+            output_uri,
+            key,
+            ctx,
+            input_netcdf_group,
+            input_file,
+            input_group_path,
+            memory_budget,
         )
 
     def convert_to_group(
@@ -1299,6 +1504,8 @@ class NetCDF4ConverterEngine(DataspaceCreator):
         input_netcdf_group: Optional[netCDF4.Group] = None,
         input_file: Optional[Union[str, Path]] = None,
         input_group_path: Optional[str] = None,
+        memory_budget: Optional[int] = None,
+        max_workers: Optional[int] = None,
     ):
         """Creates a TileDB group and its arrays from the defined CF dataspace and
         copies data into them using the converter engine.
@@ -1313,10 +1520,23 @@ class NetCDF4ConverterEngine(DataspaceCreator):
                 not be used if ``netcdf_group`` is not ``None``.
             input_group_path: If not ``None``, the path to the NetCDF group to copy data
                 from.
+            memory_budget: If not ``None``, the maximum number of bytes to read from
+                NetCDF at once when copying data into a TileDB array. The data is
+                copied in blocks that fit in the budget.
+            max_workers: If not ``None``, the maximum number of threads used to copy
+                data into different TileDB arrays at the same time. Reads from the
+                NetCDF file are serialized between threads.
         """
         self.create_group(output_uri, key, ctx)
         self.copy_to_group(
-            output_uri, key, ctx, input_netcdf_group, input_file, input_group_path
+            output_uri,
+            key,
+            ctx,
+            input_netcdf_group,
+            input_file,
+            input_group_path,
+            memory_budget,
+            max_workers,
         )
 
     def convert_to_virtual_group(
@@ -1327,6 +1547,8 @@ class NetCDF4ConverterEngine(DataspaceCreator):
         input_netcdf_group: Optional[netCDF4.Group] = None,
         input_file: Optional[Union[str, Path]] = None,
         input_group_path: Optional[str] = None,
+        memory_budget: Optional[int] = None,
+        max_workers: Optional[int] = None,
     ):
         """Creates a TileDB group and its arrays from the defined CF dataspace and
         copies data into them using the converter engine.
@@ -1341,10 +1563,23 @@ class NetCDF4ConverterEngine(DataspaceCreator):
                 not be used if ``netcdf_group`` is not ``None``.
             input_group_path: If not ``None``, the path to the NetCDF group to copy data
                 from.
+            memory_budget: If not ``None``, the maximum number of bytes to read from
+                NetCDF at once when copying data into a TileDB array. The data is
+                copied in blocks that fit in the budget.
+            max_workers: If not ``None``, the maximum number of threads used to copy
+                data into different TileDB arrays at the same time. Reads from the
+                NetCDF file are serialized between threads.
         """
         self.create_virtual_group(output_uri, key, ctx)
         self.copy_to_virtual_group(
-            output_uri, key, ctx, input_netcdf_group, input_file, input_group_path
+            output_uri,
+            key,
+            ctx,
+            input_netcdf_group,
+            input_file,
+            input_group_path,
+            memory_budget,
+            max_workers,
         )
 
     def copy_to_array(
@@ -1355,6 +1590,7 @@ class NetCDF4ConverterEngine(DataspaceCreator):
         input_netcdf_group: Optional[netCDF4.Group] = None,
         input_file: Optional[Union[str, Path]] = None,
         input_group_path: Optional[str] = None,
+        memory_budget: Optional[int] = None,
     ):
         """Copies data from a NetCDF group to a TileDB array.
 
@@ -1376,6 +1612,9 @@ class NetCDF4ConverterEngine(DataspaceCreator):
                 not be used if ``netcdf_group`` is not ``None``.
             input_group_path: If not ``None``, the path to the NetCDF group to copy data
                 from.
+            memory_budget: If not ``None``, the maximum number of bytes to read from
+                NetCDF at once when copying data into a TileDB array. The data is
+                copied in blocks that fit in the budget.
         """
         if self._registry.narray != 1:  # pragma: no cover
             raise ValueError(
@@ -1403,7 +1642,7 @@ class NetCDF4ConverterEngine(DataspaceCreator):
                 copy_group_metadata(netcdf_group, array.meta)
                 # Copy variables and variable metadata to arrays
                 if isinstance(array_creator, NetCDF4ArrayConverter):
-                    array_creator.copy(netcdf_group, array)
+                    array_creator.copy(netcdf_group, array, memory_budget)
 
     def copy_to_group(
         self,
@@ -1413,6 +1652,8 @@ class NetCDF4ConverterEngine(DataspaceCreator):
         input_netcdf_group: Optional[netCDF4.Group] = None,
         input_file: Optional[Union[str, Path]] = None,
         input_group_path: Optional[str] = None,
+        memory_budget: Optional[int] = None,
+        max_workers: Optional[int] = None,
     ):
         """Copies data from a NetCDF group to a TileDB CF dataspace.
 
@@ -1434,6 +1675,12 @@ class NetCDF4ConverterEngine(DataspaceCreator):
                 not be used if ``netcdf_group`` is not ``None``.
             input_group_path: If not ``None``, the path to the NetCDF group to copy data
                 from.
+            memory_budget: If not ``None``, the maximum number of bytes to read from
+                NetCDF at once when copying data into a TileDB array. The data is
+                copied in blocks that fit in the budget.
+            max_workers: If not ``None``, the maximum number of threads used to copy
+                data into different TileDB arrays at the same time. Reads from the
+                NetCDF file are serialized between threads.
         """
         if input_netcdf_group is None:
             input_file = (
@@ -1451,12 +1698,17 @@ class NetCDF4ConverterEngine(DataspaceCreator):
             with Group(output_uri, mode="w", key=key, ctx=ctx) as group:
                 copy_group_metadata(netcdf_group, group.meta)
             # Copy variables and variable metadata to arrays
-            for array_creator in self._registry.array_creators():
-                if isinstance(array_creator, NetCDF4ArrayConverter):
-                    with Group(
-                        output_uri, mode="w", array=array_creator.name, key=key, ctx=ctx
-                    ) as tiledb_group:
-                        array_creator.copy(netcdf_group, tiledb_group.array)
+            netcdf_lock = threading.Lock()
+
+            def copy_array(array_converter: NetCDF4ArrayConverter):
+                with Group(
+                    output_uri, mode="w", array=array_converter.name, key=key, ctx=ctx
+                ) as tiledb_group:
+                    array_converter.copy(
+                        netcdf_group, tiledb_group.array, memory_budget, netcdf_lock
+                    )
+
+            _copy_arrays(copy_array, self._array_converters(), max_workers)
 
     def copy_to_virtual_group(
         self,
@@ -1466,6 +1718,8 @@ class NetCDF4ConverterEngine(DataspaceCreator):
         input_netcdf_group: Optional[netCDF4.Group] = None,
         input_file: Optional[Union[str, Path]] = None,
         input_group_path: Optional[str] = None,
+        memory_budget: Optional[int] = None,
+        max_workers: Optional[int] = None,
     ):
         """Copies data from a NetCDF group to a TileDB CF dataspace.
 
@@ -1487,6 +1741,12 @@ class NetCDF4ConverterEngine(DataspaceCreator):
                 not be used if ``netcdf_group`` is not ``None``.
             input_group_path: If not ``None``, the path to the NetCDF group to copy data
                 from.
+            memory_budget: If not ``None``, the maximum number of bytes to read from
+                NetCDF at once when copying data into a TileDB array. The data is
+                copied in blocks that fit in the budget.
+            max_workers: If not ``None``, the maximum number of threads used to copy
+                data into different TileDB arrays at the same time. Reads from the
+                NetCDF file are serialized between threads.
         """
         if input_netcdf_group is None:
             input_file = (
@@ -1504,11 +1764,69 @@ class NetCDF4ConverterEngine(DataspaceCreator):
             with tiledb.Array(output_uri, mode="w", key=key, ctx=ctx) as array:
                 copy_group_metadata(netcdf_group, array.meta)
             # Copy variables and variable metadata to arrays
-            for array_creator in self._registry.array_creators():
-                array_uri = output_uri + "_" + array_creator.name
-                if isinstance(array_creator, NetCDF4ArrayConverter):
-                    with tiledb.open(array_uri, mode="w", key=key, ctx=ctx) as array:
-                        array_creator.copy(netcdf_group, array)
+            netcdf_lock = threading.Lock()
+
+            def copy_array(array_converter: NetCDF4ArrayConverter):
+                array_uri = output_uri + "_" + array_converter.name
+                with tiledb.open(array_uri, mode="w", key=key, ctx=ctx) as array:
+                    array_converter.copy(
+                        netcdf_group, array, memory_budget, netcdf_lock
+                    )
+
+            _copy_arrays(copy_array, self._array_converters(), max_workers)
+
+    def _array_converters(self) -> List[NetCDF4ArrayConverter]:
+        """Returns the array converters that copy data from NetCDF."""
+        return [
+            array_creator
+            for array_creator in self._registry.array_creators()
+            if isinstance(array_creator, NetCDF4ArrayConverter)
+        ]
+
+
+def _copy_arrays(
+    copy_array: Callable[[NetCDF4ArrayConverter], None],
+    array_converters: Iterable[NetCDF4ArrayConverter],
+    max_workers: Optional[int],
+):
+    """Copies data into TileDB arrays with a pool of threads.
+
+    If ``max_workers`` is ``None``, the arrays are copied one at a time and any error
+    is raised directly. Otherwise, all arrays are copied and a single error naming
+    every array that failed is raised at the end.
+
+    Parameters:
+        copy_array: Function that copies data for a single array converter.
+        array_converters: The array converters to copy data for.
+        max_workers: If not ``None``, the maximum number of threads to copy with.
+    """
+    if max_workers is None:
+        for array_converter in array_converters:
+            copy_array(array_converter)
+        return
+    if max_workers < 1:
+        raise ValueError(
+            f"Cannot copy arrays with max_workers={max_workers}. The number of "
+            f"workers must be positive."
+        )
+    errors: Dict[str, BaseException] = {}
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(copy_array, array_converter): array_converter.name
+            for array_converter in array_converters
+        }
+        for future in as_completed(futures):
+            error = future.exception()
+            if error is not None:
+                errors[futures[future]] = error
+    if errors:
+        message = "; ".join(
+            f"array '{name}' failed with {error!r}"
+            for name, error in sorted(errors.items())
+        )
+        raise RuntimeError(
+            f"Failed to copy data to {len(errors)} TileDB array(s): {message}"
+        ) from next(iter(errors.values()))
 
 
 def copy_group_metadata(netcdf_group: netCDF4.Group, meta: tiledb.libtiledb.Metadata):